@@ -18,27 +18,38 @@ __version__ = "0.1.0"
 
 from .crypto import (
     hash_sha256,
+    hash_sha256_raw,
     generate_random_bytes,
     generate_intent_id,
 )
 
 from .commitment import (
     commit,
+    commit_batch,
+    make_commit_for_value,
     verify_opening,
+    verify_openings_batch,
     commit_zero,
     add_commitments,
     subtract_commitments,
     add_blindings,
     subtract_blindings,
     generate_blinding,
+    generate_blindings,
     get_generators,
 )
 
 from .stealth import (
     generate_stealth_meta_address,
     generate_stealth_address,
+    generate_stealth_address_raw,
+    stealth_address_to_raw,
+    stealth_address_from_raw,
     derive_stealth_private_key,
     check_stealth_address,
+    check_stealth_addresses_batch,
+    StealthScanner,
+    StealthAnnouncementBatch,
     public_key_to_eth_address,
     encode_stealth_meta_address,
     decode_stealth_meta_address,
@@ -46,6 +57,7 @@ from .stealth import (
 
 from .privacy import (
     generate_viewing_key,
+    generate_viewing_keys,
     derive_viewing_key_hash,
     encrypt_for_viewing_key,
     decrypt_with_viewing_key,
@@ -56,6 +68,7 @@ from .types import (
     HexString,
     StealthMetaAddress,
     StealthAddress,
+    StealthAddressRaw,
     StealthAddressRecovery,
     PedersenCommitment,
     ViewingKey,
@@ -84,28 +97,40 @@ __all__ = [
     "__version__",
     # Crypto
     "hash_sha256",
+    "hash_sha256_raw",
     "generate_random_bytes",
     "generate_intent_id",
     # Commitment
     "commit",
+    "commit_batch",
+    "make_commit_for_value",
     "verify_opening",
+    "verify_openings_batch",
     "commit_zero",
     "add_commitments",
     "subtract_commitments",
     "add_blindings",
     "subtract_blindings",
     "generate_blinding",
+    "generate_blindings",
     "get_generators",
     # Stealth
     "generate_stealth_meta_address",
     "generate_stealth_address",
+    "generate_stealth_address_raw",
+    "stealth_address_to_raw",
+    "stealth_address_from_raw",
     "derive_stealth_private_key",
     "check_stealth_address",
+    "check_stealth_addresses_batch",
+    "StealthScanner",
+    "StealthAnnouncementBatch",
     "public_key_to_eth_address",
     "encode_stealth_meta_address",
     "decode_stealth_meta_address",
     # Privacy
     "generate_viewing_key",
+    "generate_viewing_keys",
     "derive_viewing_key_hash",
     "encrypt_for_viewing_key",
     "decrypt_with_viewing_key",
@@ -114,6 +139,7 @@ __all__ = [
     "HexString",
     "StealthMetaAddress",
     "StealthAddress",
+    "StealthAddressRaw",
     "StealthAddressRecovery",
     "PedersenCommitment",
     "ViewingKey",
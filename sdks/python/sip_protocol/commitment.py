@@ -11,88 +11,287 @@ Security Properties:
 Generator H Construction:
 H is constructed using "nothing-up-my-sleeve" (NUMS) method to ensure
 nobody knows the discrete log of H w.r.t. G.
+
+Side Channels:
+New commitments compute r*H with libsecp256k1's scalar multiplication.
+The windowed H table is faster but reads memory at offsets taken from the
+blinding bytes, so it is only used to verify openings, where the verifier
+is handed r as part of the opening.
 """
 
+import functools
 import hashlib
+import hmac
+import os
 import secrets
-from typing import Tuple, Dict
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from coincurve import PublicKey, PrivateKey
 from coincurve._libsecp256k1 import ffi, lib
+from coincurve.context import GLOBAL_CONTEXT
 
 from .types import HexString, PedersenCommitment
 from .crypto import hex_to_bytes, bytes_to_hex
 
 
+# coincurve's shared libsecp256k1 context, used directly for all point ops
+_CTX = GLOBAL_CONTEXT.ctx
+
+# cffi cdata (secp256k1_pubkey pointers and buffers); cffi ships no type stubs
+_CData = Any
+
 # Domain separation tag for H generation
 H_DOMAIN = "SIP-PEDERSEN-GENERATOR-H-v1"
 
 # secp256k1 curve order
 CURVE_ORDER = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
 
+# secp256k1 field prime and generator x-coordinate
+FIELD_PRIME = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
+GENERATOR_X = 0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798
+
+
+def _is_x_coordinate(x: int) -> bool:
+    """Check whether x is the x-coordinate of a secp256k1 point (y^2 = x^3 + 7)."""
+    if x >= FIELD_PRIME:
+        return False
+    rhs = (pow(x, 3, FIELD_PRIME) + 7) % FIELD_PRIME
+    # Euler's criterion: rhs is a square mod p unless rhs^((p-1)/2) == -1
+    return pow(rhs, (FIELD_PRIME - 1) // 2, FIELD_PRIME) != FIELD_PRIME - 1
+
 
 def _generate_h() -> bytes:
     """
     Generate the independent generator H using NUMS method.
 
-    Uses try-and-increment approach:
+    Uses try-and-increment approach (matching the other SIP SDKs):
     1. Hash the domain separator to get a candidate x-coordinate
-    2. Try to lift x to a curve point
-    3. If it fails, increment counter and retry
+    2. Check x lifts to a curve point (Euler's criterion on x^3 + 7)
+    3. If it does not, increment counter and retry
+
+    The lift check is plain integer arithmetic, so no candidate point is
+    handed to libsecp256k1 and no exceptions drive the loop.
     """
     for counter in range(256):
         # Create candidate x-coordinate
         input_data = f"{H_DOMAIN}:{counter}".encode("utf-8")
         hash_bytes = hashlib.sha256(input_data).digest()
+        x = int.from_bytes(hash_bytes, "big")
 
-        try:
-            # Try to create a point from this x-coordinate (with even y)
-            # The '02' prefix indicates compressed point with even y
-            point_bytes = bytes([0x02]) + hash_bytes
-
-            # Validate this is a valid curve point
-            PublicKey(point_bytes)
-
-            # Check it's not the identity or base point
-            # (coincurve doesn't easily expose G, but this hash won't collide)
-            return point_bytes
-        except Exception:
-            # Not a valid point, try next counter
-            continue
+        # The '02' prefix selects the point with even y; skip G itself
+        if _is_x_coordinate(x) and x != GENERATOR_X:
+            return bytes([0x02]) + hash_bytes
 
     raise RuntimeError("Failed to generate H point - this should never happen")
 
 
-# The independent generator H (NUMS point)
-_H_BYTES = _generate_h()
-
+# The independent generator H (NUMS point), i.e. the output of _generate_h().
+# Shipped as a constant to keep the derivation loop out of every import; set
+# SIP_VERIFY_GENERATORS=1 to re-derive and check it at import time.
+_H_BYTES = bytes.fromhex("02a4d34f1618b24211ad9aa88d137b4103f30aa66599e018efd6d6d6add211a34a")
+
+if os.environ.get("SIP_VERIFY_GENERATORS") and _generate_h() != _H_BYTES:
+    raise RuntimeError("Hardcoded generator H does not match its NUMS derivation")
+
+# The secp256k1 base generator G (compressed)
+_G_BYTES = bytes.fromhex("0279be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798")
+
+# Fixed-base table for H with 8-bit windows: entry [256*i + j] = j * 256^i * H.
+# Built on first use (~8K point additions, 512 KiB) to keep import fast.
+# Lookups are indexed by the scalar, so only verification uses the table.
+_H_TABLE_WINDOWS = 32
+_H_WINDOW_OFFSETS = tuple(range(0, 256 * _H_TABLE_WINDOWS, 256))
+# (table, entry pointers), published once under _h_table_lock. The pointers
+# do not own the array, so the pair is stored together to keep it alive.
+_h_table: Optional[Tuple[_CData, List[_CData]]] = None
+_h_table_lock = threading.Lock()
+
+
+def _build_h_table() -> _CData:
+    """Precompute the windowed multiples of H used by _h_multiples."""
+    ctx = _CTX
+    table = ffi.new(f"secp256k1_pubkey[{_H_TABLE_WINDOWS * 256}]")
+    base = ffi.new("secp256k1_pubkey *")
+    _parse_point(base, _H_BYTES)
+    next_base = ffi.new("secp256k1_pubkey *")
+
+    for i in range(_H_TABLE_WINDOWS):
+        row = table + 256 * i
+        row[1] = base[0]
+        for j in range(2, 256):
+            lib.secp256k1_ec_pubkey_combine(ctx, row + j, [row + (j - 1), base], 2)
+        # 256^(i+1) * H = 255 * 256^i * H + 256^i * H
+        lib.secp256k1_ec_pubkey_combine(ctx, next_base, [row + 255, base], 2)
+        base[0] = next_base[0]
+
+    return table
+
+
+def _load_h_table() -> List[_CData]:
+    """Build the H table once (thread-safe) and return pointers to its entries."""
+    global _h_table
+    with _h_table_lock:
+        if _h_table is None:
+            table = _build_h_table()
+            # Pointer arithmetic is done once here rather than per lookup
+            _h_table = (table, [table + k for k in range(_H_TABLE_WINDOWS * 256)])
+        return _h_table[1]
+
+
+def _h_multiples(scalar: int) -> List[_CData]:
+    """
+    Return the table entries whose sum is scalar * H.
 
-def _point_multiply(scalar: int, point_bytes: bytes) -> bytes:
-    """Multiply a point by a scalar."""
-    # Use coincurve for point operations
-    point = PublicKey(point_bytes)
-    result = point.multiply(scalar.to_bytes(32, "big"))
-    return result.format(compressed=True)
+    Which entries are read, and how many, depends on the scalar, so this
+    must not be used with a blinding factor that is still secret.
+    """
+    loaded = _h_table
+    entries = loaded[1] if loaded is not None else _load_h_table()
+    return [
+        entries[offset + window]
+        for offset, window in zip(_H_WINDOW_OFFSETS, scalar.to_bytes(32, "little"))
+        if window
+    ]
+
+
+def _combine(points: List[_CData], result: Optional[_CData] = None) -> _CData:
+    """Sum secp256k1_pubkey points with one secp256k1_ec_pubkey_combine call."""
+    # libsecp256k1 aborts the process on n == 0, so the empty sum is rejected here
+    if not points:
+        raise ValueError("Point sum is the point at infinity")
+    if result is None:
+        result = ffi.new("secp256k1_pubkey *")
+    if not lib.secp256k1_ec_pubkey_combine(_CTX, result, points, len(points)):
+        raise ValueError("Point sum is the point at infinity")
+    return result
+
+
+# Per-thread scratch space for raw libsecp256k1 calls: two input points plus
+# an output point, the input pointer array, and the serialization buffer.
+_scratch = threading.local()
+
+
+def _scratch_buffers() -> Tuple[_CData, _CData, _CData, _CData]:
+    buffers = getattr(_scratch, "buffers", None)
+    if buffers is None:
+        points = ffi.new("secp256k1_pubkey[3]")
+        inputs = ffi.new("secp256k1_pubkey *[2]", [points, points + 1])
+        buffers = (points, inputs, ffi.new("unsigned char[33]"), ffi.new("size_t *"))
+        _scratch.buffers = buffers
+    return buffers
+
+
+def _parse_point(out: _CData, point_bytes: bytes) -> None:
+    """Parse a serialized point into a secp256k1_pubkey."""
+    if not lib.secp256k1_ec_pubkey_parse(_CTX, out, point_bytes, len(point_bytes)):
+        raise ValueError("The point could not be parsed or is invalid")
+
+
+def _serialize_point(point: _CData) -> bytes:
+    """Serialize a secp256k1_pubkey in compressed form."""
+    _, _, output, output_len = _scratch_buffers()
+    output_len[0] = 33
+    lib.secp256k1_ec_pubkey_serialize(
+        _CTX, output, output_len, point, lib.SECP256K1_EC_COMPRESSED
+    )
+    return bytes(ffi.buffer(output, 33))
 
 
 def _point_add(point1_bytes: bytes, point2_bytes: bytes) -> bytes:
     """Add two curve points."""
-    point1 = PublicKey(point1_bytes)
-    result = point1.combine([PublicKey(point2_bytes)])
-    return result.format(compressed=True)
+    points, inputs, _, _ = _scratch_buffers()
+    _parse_point(points, point1_bytes)
+    _parse_point(points + 1, point2_bytes)
+    if not lib.secp256k1_ec_pubkey_combine(_CTX, points + 2, inputs, 2):
+        raise ValueError("Point sum is the point at infinity")
+    return _serialize_point(points + 2)
+
 
+def _point_subtract(point1_bytes: bytes, point2_bytes: bytes) -> bytes:
+    """Subtract the second curve point from the first."""
+    points, inputs, _, _ = _scratch_buffers()
+    _parse_point(points, point1_bytes)
+    _parse_point(points + 1, point2_bytes)
+    lib.secp256k1_ec_pubkey_negate(_CTX, points + 1)
+    if not lib.secp256k1_ec_pubkey_combine(_CTX, points + 2, inputs, 2):
+        raise ValueError("Point difference is the point at infinity")
+    return _serialize_point(points + 2)
 
-def _get_generator_g() -> bytes:
-    """Get the base generator G."""
-    # G is the public key for private key = 1
-    priv = PrivateKey(b"\x00" * 31 + b"\x01")
-    return priv.public_key.format(compressed=True)
 
+# H as a parsed secp256k1_pubkey, copied out before each multiplication
+_H_POINT = ffi.new("secp256k1_pubkey *")
+_parse_point(_H_POINT, _H_BYTES)
 
-_G_BYTES = _get_generator_g()
 
+def _blinding_times_h(r_scalar: int, out: _CData) -> _CData:
+    """Compute r*H into out with secp256k1_ec_pubkey_tweak_mul (no H table)."""
+    out[0] = _H_POINT[0]
+    if not lib.secp256k1_ec_pubkey_tweak_mul(_CTX, out, r_scalar.to_bytes(32, "big")):
+        raise ValueError("Blinding must be greater than 0 and less than the curve order")
+    return out
 
-def commit(value: int, blinding: bytes = None) -> Tuple[HexString, HexString]:
+
+@functools.lru_cache(maxsize=1024)
+def _value_times_g(value: int) -> _CData:
+    """
+    Compute value * G, cached per value.
+
+    Uses secp256k1_ec_pubkey_create, which runs libsecp256k1's fixed-base
+    ecmult_gen comb for G rather than a generic variable-base multiply.
+    Transfers tend to reuse a small set of amounts, so a cache hit removes
+    the G multiplication from a commitment entirely. The returned
+    secp256k1_pubkey is shared and must not be modified.
+    """
+    point = ffi.new("secp256k1_pubkey *")
+    if not lib.secp256k1_ec_pubkey_create(_CTX, point, value.to_bytes(32, "big")):
+        raise ValueError("Value must be greater than 0 and less than the curve order")
+    return point
+
+
+def _value_term(value: int) -> Optional[_CData]:
+    """Return the v*G point for a commitment, or None for v = 0."""
+    return _value_times_g(value) if value != 0 else None
+
+
+def _commit_point(v_g: Optional[_CData], r_scalar: int) -> bytes:
+    """
+    Compute C = v*G + r*H as a compressed point for a new commitment.
+
+    v_g is the precomputed v*G from _value_term. r*H goes through
+    _blinding_times_h rather than the H table, since r is the secret that
+    hides the value. The sum is formed in thread-local scratch, so the only
+    per-call allocation is the output.
+    """
+    points = _scratch_buffers()[0]
+    r_h = _blinding_times_h(r_scalar, points + 1)
+    if v_g is None:
+        return _serialize_point(r_h)
+    return _serialize_point(_combine([r_h, v_g], points + 2))
+
+
+def _opening_point(value: int, r_scalar: int) -> bytes:
+    """
+    Recompute C = v*G + r*H for an opening being verified.
+
+    The verifier already holds r, so the H table entries for r*H and the
+    (cached) v*G are summed in a single secp256k1_ec_pubkey_combine call.
+    """
+    points = _h_multiples(r_scalar)
+    if value != 0:
+        points.append(_value_times_g(value))
+    return _serialize_point(_combine(points, _scratch_buffers()[0] + 2))
+
+
+def _reduce_scalar(scalar_bytes: bytes) -> int:
+    """Interpret 32 bytes as a scalar mod n."""
+    scalar = int.from_bytes(scalar_bytes, "big")
+    # Random 32-byte values are below n with overwhelming probability
+    if scalar >= CURVE_ORDER:
+        scalar %= CURVE_ORDER
+    return scalar
+
+
+def commit(value: int, blinding: Optional[bytes] = None) -> Tuple[HexString, HexString]:
     """
     Create a Pedersen commitment to a value.
 
@@ -116,11 +315,54 @@ def commit(value: int, blinding: bytes = None) -> Tuple[HexString, HexString]:
         >>> verify_opening(commitment, 100, blinding)
         True
     """
+    _validate_value(value)
+    blinding, r_scalar = _prepare_blinding(blinding)
+
+    # C = v*G + r*H
+    c_bytes = _commit_point(_value_term(value), r_scalar)
+
+    return (bytes_to_hex(c_bytes), bytes_to_hex(blinding))
+
+
+def commit_batch(values: List[int]) -> List[Tuple[HexString, HexString]]:
+    """
+    Create Pedersen commitments to several values with random blindings.
+
+    Blinding factors for the whole batch are drawn with a single RNG call.
+
+    Args:
+        values: The values to commit to (each must be < curve order)
+
+    Returns:
+        List of (commitment, blinding) tuples as hex strings, in input order
+
+    Example:
+        >>> openings = commit_batch([100, 250])
+        >>> verify_opening(openings[0][0], 100, openings[0][1])
+        True
+    """
+    for value in values:
+        _validate_value(value)
+
+    results = []
+    for value, blinding in zip(values, _random_blindings(len(values))):
+        blinding, r_scalar = _prepare_blinding(blinding)
+        c_bytes = _commit_point(_value_term(value), r_scalar)
+        results.append((bytes_to_hex(c_bytes), bytes_to_hex(blinding)))
+
+    return results
+
+
+def _validate_value(value: int) -> None:
+    """Check that a value can be committed to."""
     if value < 0:
         raise ValueError("Value must be non-negative")
     if value >= CURVE_ORDER:
         raise ValueError("Value must be less than curve order")
 
+
+def _prepare_blinding(blinding: Optional[bytes]) -> Tuple[bytes, int]:
+    """Generate or validate a blinding factor and reduce it to a scalar."""
     # Generate or use provided blinding factor
     if blinding is None:
         blinding = secrets.token_bytes(32)
@@ -128,21 +370,46 @@ def commit(value: int, blinding: bytes = None) -> Tuple[HexString, HexString]:
         raise ValueError("Blinding must be 32 bytes")
 
     # Ensure blinding is in valid range (mod n)
-    r_scalar = int.from_bytes(blinding, "big") % CURVE_ORDER
+    r_scalar = _reduce_scalar(blinding)
     if r_scalar == 0:
         raise RuntimeError("CRITICAL: Zero blinding scalar - investigate RNG")
 
-    # C = v*G + r*H
-    if value == 0:
-        # Only blinding contributes: C = r*H
-        c_bytes = _point_multiply(r_scalar, _H_BYTES)
-    else:
-        # Normal case: C = v*G + r*H
-        v_g = _point_multiply(value, _G_BYTES)
-        r_h = _point_multiply(r_scalar, _H_BYTES)
-        c_bytes = _point_add(v_g, r_h)
+    return blinding, r_scalar
 
-    return (bytes_to_hex(c_bytes), bytes_to_hex(blinding))
+
+def make_commit_for_value(
+    value: int,
+) -> Callable[[Optional[bytes]], Tuple[HexString, HexString]]:
+    """
+    Build a commit function specialized to a fixed value.
+
+    v*G is computed once here, so each call of the returned function only
+    pays for r*H and a point add. Wallets that transfer fixed denominations
+    can build one per denomination at startup and reuse them.
+
+    Args:
+        value: The value every commitment will be to (must be < curve order)
+
+    Returns:
+        Function taking an optional 32-byte blinding and returning
+        (commitment, blinding) as hex strings, like commit()
+
+    Example:
+        >>> commit_1000 = make_commit_for_value(1000)
+        >>> commitment, blinding = commit_1000()
+        >>> verify_opening(commitment, 1000, blinding)
+        True
+    """
+    _validate_value(value)
+    v_g = _value_term(value)
+
+    def commit_fixed(blinding: Optional[bytes] = None) -> Tuple[HexString, HexString]:
+        blinding, r_scalar = _prepare_blinding(blinding)
+        c_bytes = _commit_point(v_g, r_scalar)
+
+        return (bytes_to_hex(c_bytes), bytes_to_hex(blinding))
+
+    return commit_fixed
 
 
 def verify_opening(commitment: HexString, value: int, blinding: HexString) -> bool:
@@ -160,21 +427,50 @@ def verify_opening(commitment: HexString, value: int, blinding: HexString) -> bo
         True if the commitment opens correctly
     """
     try:
-        # Parse the commitment point
-        c_bytes = hex_to_bytes(commitment)
+        return _verify_opening_bytes(hex_to_bytes(commitment), value, hex_to_bytes(blinding))
+    except Exception:
+        return False
+
+
+def _verify_opening_bytes(c_bytes: bytes, value: int, blinding_bytes: bytes) -> bool:
+    """Recompute v*G + r*H from raw bytes and compare it with the commitment."""
+    r_scalar = _reduce_scalar(blinding_bytes)
+    expected = _opening_point(value, r_scalar)
+    # Constant-time compare so the result does not leak the mismatch position
+    return hmac.compare_digest(c_bytes, expected)
+
 
-        # Recompute expected commitment
-        blinding_bytes = hex_to_bytes(blinding)
-        r_scalar = int.from_bytes(blinding_bytes, "big") % CURVE_ORDER
+def verify_openings_batch(
+    commitments: List[HexString],
+    values: List[int],
+    blindings: List[HexString],
+) -> bool:
+    """
+    Verify that every commitment opens to its value and blinding.
+
+    Each opening is recomputed through the fixed-base H table, which is
+    cheaper than the variable-base multiplications a random linear
+    combination check would need without a multi-exponentiation backend.
+
+    Args:
+        commitments: The commitment points to verify
+        values: The claimed values, one per commitment
+        blindings: The blinding factors, one per commitment
+
+    Returns:
+        True if all commitments open correctly
 
-        if value == 0:
-            expected = _point_multiply(r_scalar, _H_BYTES)
-        else:
-            v_g = _point_multiply(value, _G_BYTES)
-            r_h = _point_multiply(r_scalar, _H_BYTES)
-            expected = _point_add(v_g, r_h)
+    Raises:
+        ValueError: If the input lists differ in length
+    """
+    if not len(commitments) == len(values) == len(blindings):
+        raise ValueError("commitments, values and blindings must have the same length")
 
-        return c_bytes == expected
+    try:
+        return all(
+            _verify_opening_bytes(hex_to_bytes(commitment), value, hex_to_bytes(blinding))
+            for commitment, value, blinding in zip(commitments, values, blindings)
+        )
     except Exception:
         return False
 
@@ -212,10 +508,12 @@ def add_commitments(c1: HexString, c2: HexString) -> HexString:
     Returns:
         Sum of commitments
     """
-    c1_bytes = hex_to_bytes(c1)
-    c2_bytes = hex_to_bytes(c2)
-    result = _point_add(c1_bytes, c2_bytes)
-    return bytes_to_hex(result)
+    return bytes_to_hex(_add_commitments_bytes(hex_to_bytes(c1), hex_to_bytes(c2)))
+
+
+def _add_commitments_bytes(c1: bytes, c2: bytes) -> bytes:
+    """Add two compressed commitment points."""
+    return _point_add(c1, c2)
 
 
 def subtract_commitments(c1: HexString, c2: HexString) -> HexString:
@@ -231,14 +529,13 @@ def subtract_commitments(c1: HexString, c2: HexString) -> HexString:
     Returns:
         Difference of commitments
     """
-    c1_bytes = hex_to_bytes(c1)
-    c2_bytes = hex_to_bytes(c2)
+    return bytes_to_hex(_subtract_commitments_bytes(hex_to_bytes(c1), hex_to_bytes(c2)))
 
-    # Negate c2 by negating the y-coordinate (flip parity byte)
-    c2_negated = bytes([0x03 if c2_bytes[0] == 0x02 else 0x02]) + c2_bytes[1:]
 
-    result = _point_add(c1_bytes, c2_negated)
-    return bytes_to_hex(result)
+def _subtract_commitments_bytes(c1: bytes, c2: bytes) -> bytes:
+    """Subtract two compressed commitment points."""
+    # c2 is negated in place after parsing, so no negated copy is serialized
+    return _point_subtract(c1, c2)
 
 
 def add_blindings(b1: HexString, b2: HexString) -> HexString:
@@ -252,12 +549,20 @@ def add_blindings(b1: HexString, b2: HexString) -> HexString:
     Returns:
         Sum of blindings (mod curve order)
     """
-    r1 = int.from_bytes(hex_to_bytes(b1), "big")
-    r2 = int.from_bytes(hex_to_bytes(b2), "big")
-    result = (r1 + r2) % CURVE_ORDER
+    result = _add_blindings_int(_scalar_from_hex(b1), _scalar_from_hex(b2))
     return bytes_to_hex(result.to_bytes(32, "big"))
 
 
+def _scalar_from_hex(hex_str: HexString) -> int:
+    """Parse a hex blinding factor to an int (strict hex, unlike int(s, 16))."""
+    return int.from_bytes(hex_to_bytes(hex_str), "big")
+
+
+def _add_blindings_int(r1: int, r2: int) -> int:
+    """Add two blinding scalars mod n."""
+    return (r1 + r2) % CURVE_ORDER
+
+
 def subtract_blindings(b1: HexString, b2: HexString) -> HexString:
     """
     Subtract blinding factors (for use with homomorphic subtraction).
@@ -269,37 +574,68 @@ def subtract_blindings(b1: HexString, b2: HexString) -> HexString:
     Returns:
         Difference of blindings (mod curve order)
     """
-    r1 = int.from_bytes(hex_to_bytes(b1), "big")
-    r2 = int.from_bytes(hex_to_bytes(b2), "big")
-    result = (r1 - r2 + CURVE_ORDER) % CURVE_ORDER
+    result = _subtract_blindings_int(_scalar_from_hex(b1), _scalar_from_hex(b2))
     return bytes_to_hex(result.to_bytes(32, "big"))
 
 
+def _subtract_blindings_int(r1: int, r2: int) -> int:
+    """Subtract two blinding scalars mod n."""
+    return (r1 - r2) % CURVE_ORDER
+
+
 def generate_blinding() -> HexString:
     """Generate a random blinding factor."""
     return bytes_to_hex(secrets.token_bytes(32))
 
 
+def _random_blindings(count: int) -> List[bytes]:
+    """Draw count 32-byte blinding factors from a single RNG call."""
+    buffer = secrets.token_bytes(32 * count)
+    return [buffer[i : i + 32] for i in range(0, 32 * count, 32)]
+
+
+def generate_blindings(count: int) -> List[HexString]:
+    """
+    Generate multiple random blinding factors.
+
+    Reads all the randomness in one call instead of one per blinding.
+
+    Args:
+        count: Number of blinding factors to generate
+
+    Returns:
+        List of blinding factors as hex strings
+    """
+    if count < 0:
+        raise ValueError("Count must be non-negative")
+    return [bytes_to_hex(blinding) for blinding in _random_blindings(count)]
+
+
+def _affine_coordinates(point_bytes: bytes) -> Tuple[HexString, HexString]:
+    """Get the (x, y) coordinates of a compressed point."""
+    point = ffi.new("secp256k1_pubkey *")
+    _parse_point(point, point_bytes)
+    output = ffi.new("unsigned char[65]")
+    output_len = ffi.new("size_t *", 65)
+    lib.secp256k1_ec_pubkey_serialize(
+        _CTX, output, output_len, point, lib.SECP256K1_EC_UNCOMPRESSED
+    )
+    uncompressed = bytes(ffi.buffer(output, 65))
+    return bytes_to_hex(uncompressed[1:33]), bytes_to_hex(uncompressed[33:])
+
+
+# Generator coordinates are constants, so decompress them once at import
+_G_COORDINATES = _affine_coordinates(_G_BYTES)
+_H_COORDINATES = _affine_coordinates(_H_BYTES)
+
+
 def get_generators() -> Dict[str, Dict[str, HexString]]:
     """
     Get the generators for ZK proof integration.
 
     Returns the G and H points for use in ZK circuits.
     """
-    g_point = PublicKey(_G_BYTES)
-    h_point = PublicKey(_H_BYTES)
-
-    # Get uncompressed format to extract x, y coordinates
-    g_uncompressed = g_point.format(compressed=False)
-    h_uncompressed = h_point.format(compressed=False)
-
     return {
-        "G": {
-            "x": bytes_to_hex(g_uncompressed[1:33]),
-            "y": bytes_to_hex(g_uncompressed[33:]),
-        },
-        "H": {
-            "x": bytes_to_hex(h_uncompressed[1:33]),
-            "y": bytes_to_hex(h_uncompressed[33:]),
-        },
+        "G": {"x": _G_COORDINATES[0], "y": _G_COORDINATES[1]},
+        "H": {"x": _H_COORDINATES[0], "y": _H_COORDINATES[1]},
     }
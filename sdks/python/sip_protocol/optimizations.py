@@ -7,6 +7,8 @@ Provides optimized configurations for different blockchains:
 - Cross-chain cost comparison
 """
 
+import functools
+import operator
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional, List, Tuple, Dict
@@ -79,6 +81,33 @@ SOLANA_DEFAULT_PRIORITY_FEE = 1_000  # microlamports per CU
 EVM_BASE_GAS_PRICE = 30_000_000_000  # 30 gwei in wei
 ONE_GWEI = 1_000_000_000
 
+# Priority fee multipliers per profile
+SOLANA_PROFILE_MULTIPLIERS: Dict[OptimizationProfile, float] = {
+    OptimizationProfile.ECONOMY: 0.5,
+    OptimizationProfile.STANDARD: 1.0,
+    OptimizationProfile.FAST: 2.0,
+    OptimizationProfile.URGENT: 5.0,
+}
+
+EVM_PROFILE_MULTIPLIERS: Dict[OptimizationProfile, float] = {
+    OptimizationProfile.ECONOMY: 0.8,
+    OptimizationProfile.STANDARD: 1.0,
+    OptimizationProfile.FAST: 1.5,
+    OptimizationProfile.URGENT: 2.5,
+}
+
+# Estimated execution cost per transaction complexity
+SOLANA_COMPLEXITY_CU: Dict[str, int] = {"simple": 50_000, "medium": 150_000, "complex": 300_000}
+EVM_COMPLEXITY_GAS: Dict[str, int] = {"simple": 50_000, "medium": 150_000, "complex": 500_000}
+
+COST_TIER_RECOMMENDATIONS: Dict[int, str] = {
+    1: "Excellent - very low costs",
+    2: "Good - affordable for frequent use",
+    3: "Moderate - suitable for medium value txs",
+    4: "Expensive - use for high value only",
+    5: "Very expensive - consider alternatives",
+}
+
 
 # ─── Chain Database ────────────────────────────────────────────────────────────
 
@@ -150,6 +179,7 @@ CHAIN_CHARACTERISTICS: Dict[str, ChainCharacteristics] = {
 }
 
 
+@functools.lru_cache(maxsize=256)
 def detect_chain_family(chain_id: str) -> ChainFamily:
     """Detect chain family from chain identifier."""
     normalized = chain_id.lower()
@@ -166,8 +196,14 @@ def detect_chain_family(chain_id: str) -> ChainFamily:
         return ChainFamily.EVM  # Default
 
 
+@functools.lru_cache(maxsize=256)
 def get_chain_characteristics(chain_id: str) -> ChainCharacteristics:
-    """Get chain characteristics."""
+    """
+    Get chain characteristics.
+
+    Results are memoized per chain_id, so callers receive a shared
+    instance and must not modify it.
+    """
     lower_id = chain_id.lower()
 
     # Try direct lookup
@@ -202,14 +238,7 @@ def calculate_solana_budget(
     # Add 20% buffer
     units = min(int(estimated_cu * 1.2), SOLANA_MAX_CU)
 
-    # Profile multipliers
-    multipliers = {
-        OptimizationProfile.ECONOMY: 0.5,
-        OptimizationProfile.STANDARD: 1.0,
-        OptimizationProfile.FAST: 2.0,
-        OptimizationProfile.URGENT: 5.0,
-    }
-    multiplier = multipliers[profile]
+    multiplier = SOLANA_PROFILE_MULTIPLIERS[profile]
 
     base_fee = current_median_fee or SOLANA_DEFAULT_PRIORITY_FEE
     microlamports_per_cu = max(int(base_fee * multiplier), 100)
@@ -257,14 +286,7 @@ def calculate_evm_gas(
     """Calculate EVM gas configuration."""
     base = base_fee or EVM_BASE_GAS_PRICE
 
-    # Profile multipliers
-    multipliers = {
-        OptimizationProfile.ECONOMY: 0.8,
-        OptimizationProfile.STANDARD: 1.0,
-        OptimizationProfile.FAST: 1.5,
-        OptimizationProfile.URGENT: 2.5,
-    }
-    multiplier = multipliers[profile]
+    multiplier = EVM_PROFILE_MULTIPLIERS[profile]
 
     base_priority = 2 * ONE_GWEI  # 2 gwei
     max_priority_fee_per_gas = int(base_priority * multiplier)
@@ -328,8 +350,7 @@ def select_optimal_config(
     evm_config = None
 
     if characteristics.family == ChainFamily.SOLANA:
-        cu_map = {"simple": 50_000, "medium": 150_000, "complex": 300_000}
-        estimated_cu = cu_map.get(complexity, 150_000)
+        estimated_cu = SOLANA_COMPLEXITY_CU.get(complexity, 150_000)
         solana_config = calculate_solana_budget(estimated_cu, profile)
 
         recommendations.append(
@@ -341,8 +362,7 @@ def select_optimal_config(
             )
 
     elif characteristics.family == ChainFamily.EVM:
-        gas_map = {"simple": 50_000, "medium": 150_000, "complex": 500_000}
-        estimated_gas = gas_map.get(complexity, 150_000)
+        estimated_gas = EVM_COMPLEXITY_GAS.get(complexity, 150_000)
         evm_config = calculate_evm_gas(estimated_gas, profile)
 
         if characteristics.is_l2:
@@ -384,18 +404,11 @@ def compare_chain_costs(
     """
     results = []
     for chain in chains:
-        chars = get_chain_characteristics(chain)
-        recommendations = {
-            1: "Excellent - very low costs",
-            2: "Good - affordable for frequent use",
-            3: "Moderate - suitable for medium value txs",
-            4: "Expensive - use for high value only",
-            5: "Very expensive - consider alternatives",
-        }
-        rec = recommendations.get(chars.cost_tier, "Unknown")
-        results.append((chain, chars.cost_tier, rec))
+        tier = get_chain_characteristics(chain).cost_tier
+        results.append((chain, tier, COST_TIER_RECOMMENDATIONS.get(tier, "Unknown")))
 
-    return sorted(results, key=lambda x: x[1])
+    results.sort(key=operator.itemgetter(1))
+    return results
 
 
 def recommend_cheapest_chain(
@@ -403,17 +416,14 @@ def recommend_cheapest_chain(
     max_block_time: Optional[float] = None,
 ) -> Optional[str]:
     """Recommend cheapest viable chain."""
-    viable = [
-        chain
-        for chain in chains
-        if max_block_time is None
-        or get_chain_characteristics(chain).block_time <= max_block_time
-    ]
+    # Single pass: filter on block time and collect cost tiers together
+    viable = []
+    for chain in chains:
+        chars = get_chain_characteristics(chain)
+        if max_block_time is None or chars.block_time <= max_block_time:
+            viable.append((chain, chars.cost_tier))
 
     if not viable:
         return None
 
-    return min(
-        viable,
-        key=lambda c: get_chain_characteristics(c).cost_tier,
-    )
+    return min(viable, key=operator.itemgetter(1))[0]
@@ -7,16 +7,48 @@ Provides:
 - Selective disclosure for compliance
 """
 
-import hashlib
 import secrets
 import time
-from typing import Optional
+from hashlib import sha256
+from typing import Callable, List, Optional
 
 from Crypto.Cipher import ChaCha20_Poly1305
 
 from .types import HexString, ViewingKey, EncryptedPayload, PrivacyLevel
 from .crypto import hex_to_bytes, bytes_to_hex
 
+# (message, associated data, nonce, key) -> bytes, or None without PyNaCl
+_SodiumAead = Optional[Callable[[bytes, Optional[bytes], bytes, bytes], bytes]]
+_sodium_decrypt: _SodiumAead
+_sodium_encrypt: _SodiumAead
+
+try:
+    # libsodium's vectorized XChaCha20-Poly1305, used when PyNaCl is installed
+    from nacl.bindings import (
+        crypto_aead_xchacha20poly1305_ietf_decrypt as _nacl_decrypt,
+    )
+    from nacl.bindings import (
+        crypto_aead_xchacha20poly1305_ietf_encrypt as _nacl_encrypt,
+    )
+    from nacl.exceptions import CryptoError as _SodiumError
+
+    _sodium_decrypt = _nacl_decrypt
+    _sodium_encrypt = _nacl_encrypt
+except ImportError:
+    _sodium_decrypt = None
+    _sodium_encrypt = None
+
+# Canonical level values, for validate_privacy_level's fast path
+_PRIVACY_LEVELS = {level.value: level for level in PrivacyLevel}
+
+# Per-level routing: (encrypt, include viewing key)
+_PRIVACY_POLICY = {
+    PrivacyLevel.TRANSPARENT: (False, False),
+    PrivacyLevel.SHIELDED: (True, False),
+    PrivacyLevel.COMPLIANT: (True, True),
+}
+_NO_POLICY = (False, False)
+
 
 def generate_viewing_key(label: Optional[str] = None) -> ViewingKey:
     """
@@ -34,12 +66,45 @@ def generate_viewing_key(label: Optional[str] = None) -> ViewingKey:
         '0xabc123...'
     """
     key = secrets.token_bytes(32)
-    key_hash = hashlib.sha256(key).digest()
-    created_at = int(time.time() * 1000)
+    return _make_viewing_key(key, _now_ms(), label)
+
+
+def generate_viewing_keys(count: int, label: Optional[str] = None) -> List[ViewingKey]:
+    """
+    Generate multiple viewing keys.
+
+    Reads all the key material in one call instead of one per key.
+
+    Args:
+        count: Number of viewing keys to generate
+        label: Optional human-readable label applied to every key
 
+    Returns:
+        List of ViewingKey objects sharing the same creation timestamp
+
+    Example:
+        >>> keys = generate_viewing_keys(100, "auditors")
+    """
+    if count < 0:
+        raise ValueError("Count must be non-negative")
+    buffer = secrets.token_bytes(32 * count)
+    created_at = _now_ms()
+    return [
+        _make_viewing_key(buffer[i : i + 32], created_at, label)
+        for i in range(0, 32 * count, 32)
+    ]
+
+
+def _now_ms() -> int:
+    """Current Unix time in milliseconds, using integer arithmetic only."""
+    return time.time_ns() // 1_000_000
+
+
+def _make_viewing_key(key: bytes, created_at: int, label: Optional[str]) -> ViewingKey:
+    """Build a ViewingKey from raw key bytes."""
     return ViewingKey(
         key=bytes_to_hex(key),
-        key_hash=bytes_to_hex(key_hash),
+        key_hash=bytes_to_hex(_viewing_key_hash(key)),
         created_at=created_at,
         label=label,
     )
@@ -61,9 +126,53 @@ def derive_viewing_key_hash(viewing_key: HexString) -> HexString:
     Example:
         >>> key_hash = derive_viewing_key_hash(vk.key)
     """
-    key_bytes = hex_to_bytes(viewing_key)
-    hash_bytes = hashlib.sha256(key_bytes).digest()
-    return bytes_to_hex(hash_bytes)
+    # Hash straight to hex, skipping the intermediate digest bytes
+    return HexString("0x" + sha256(hex_to_bytes(viewing_key)).hexdigest())
+
+
+def _viewing_key_hash(key_bytes: bytes) -> bytes:
+    """Raw SHA-256 of a viewing key, for internal equality checks and indexing."""
+    return sha256(key_bytes).digest()
+
+
+def _aead_encrypt(key: bytes, nonce: bytes, plaintext: bytes) -> bytes:
+    """XChaCha20-Poly1305 encrypt, returning ciphertext with the 16-byte tag appended."""
+    if _sodium_encrypt is not None:
+        # libsodium writes ciphertext and tag into a single output buffer
+        return _sodium_encrypt(plaintext, None, nonce, key)
+
+    cipher = ChaCha20_Poly1305.new(key=key, nonce=nonce)
+    ciphertext, tag = cipher.encrypt_and_digest(plaintext)
+
+    # Append tag to ciphertext for authenticated decryption. Encrypting into a
+    # preallocated bytearray through output= is slower with PyCryptodome for
+    # small payloads and no faster at 1 MiB, so the plain concat stays.
+    return ciphertext + tag
+
+
+def _aead_decrypt(key: bytes, nonce: bytes, ciphertext_with_tag: bytes) -> bytes:
+    """XChaCha20-Poly1305 decrypt of ciphertext with the 16-byte tag appended."""
+    # Too short to hold a tag; libsodium would fail with a bare cffi ValueError
+    if len(ciphertext_with_tag) < 16:
+        raise ValueError("Decryption failed: MAC check failed")
+
+    if _sodium_decrypt is not None:
+        try:
+            # Takes the combined buffer as is, no ciphertext/tag split
+            return _sodium_decrypt(ciphertext_with_tag, None, nonce, key)
+        except _SodiumError as e:
+            raise ValueError(f"Decryption failed: {e}") from e
+
+    # Split ciphertext and tag (tag is last 16 bytes)
+    ciphertext = ciphertext_with_tag[:-16]
+    tag = ciphertext_with_tag[-16:]
+
+    cipher = ChaCha20_Poly1305.new(key=key, nonce=nonce)
+
+    try:
+        return cipher.decrypt_and_verify(ciphertext, tag)
+    except ValueError as e:
+        raise ValueError(f"Decryption failed: {e}") from e
 
 
 def encrypt_for_viewing_key(
@@ -72,7 +181,9 @@ def encrypt_for_viewing_key(
     """
     Encrypt data for viewing key holders.
 
-    Uses XChaCha20-Poly1305 for authenticated encryption.
+    Uses XChaCha20-Poly1305 for authenticated encryption, through libsodium
+    when PyNaCl is installed and PyCryptodome otherwise. Both produce the
+    same ciphertext.
 
     Args:
         viewing_key: The viewing key (32 bytes)
@@ -89,11 +200,7 @@ def encrypt_for_viewing_key(
     # XChaCha20-Poly1305 requires 24-byte nonce
     nonce = secrets.token_bytes(24)
 
-    cipher = ChaCha20_Poly1305.new(key=key_bytes, nonce=nonce)
-    ciphertext, tag = cipher.encrypt_and_digest(plaintext)
-
-    # Append tag to ciphertext for authenticated decryption
-    ciphertext_with_tag = ciphertext + tag
+    ciphertext_with_tag = _aead_encrypt(key_bytes, nonce, plaintext)
 
     return EncryptedPayload(
         ciphertext=bytes_to_hex(ciphertext_with_tag),
@@ -124,17 +231,7 @@ def decrypt_with_viewing_key(
     nonce_bytes = hex_to_bytes(payload.nonce)
     ciphertext_with_tag = hex_to_bytes(payload.ciphertext)
 
-    # Split ciphertext and tag (tag is last 16 bytes)
-    ciphertext = ciphertext_with_tag[:-16]
-    tag = ciphertext_with_tag[-16:]
-
-    cipher = ChaCha20_Poly1305.new(key=key_bytes, nonce=nonce_bytes)
-
-    try:
-        plaintext = cipher.decrypt_and_verify(ciphertext, tag)
-        return plaintext
-    except ValueError as e:
-        raise ValueError(f"Decryption failed: {e}")
+    return _aead_decrypt(key_bytes, nonce_bytes, ciphertext_with_tag)
 
 
 def validate_privacy_level(level: str) -> PrivacyLevel:
@@ -150,11 +247,13 @@ def validate_privacy_level(level: str) -> PrivacyLevel:
     Raises:
         ValueError: If level is not valid
     """
-    try:
-        return PrivacyLevel(level.lower())
-    except ValueError:
-        valid = [e.value for e in PrivacyLevel]
+    privacy_level = _PRIVACY_LEVELS.get(level)
+    if privacy_level is None:
+        privacy_level = _PRIVACY_LEVELS.get(level.lower())
+    if privacy_level is None:
+        valid = list(_PRIVACY_LEVELS)
         raise ValueError(f"Invalid privacy level: {level}. Valid options: {valid}")
+    return privacy_level
 
 
 def should_encrypt(level: PrivacyLevel) -> bool:
@@ -167,7 +266,7 @@ def should_encrypt(level: PrivacyLevel) -> bool:
     Returns:
         True if data should be encrypted
     """
-    return level in (PrivacyLevel.SHIELDED, PrivacyLevel.COMPLIANT)
+    return _PRIVACY_POLICY.get(level, _NO_POLICY)[0]
 
 
 def should_include_viewing_key(level: PrivacyLevel) -> bool:
@@ -180,4 +279,4 @@ def should_include_viewing_key(level: PrivacyLevel) -> bool:
     Returns:
         True if viewing key should be included
     """
-    return level == PrivacyLevel.COMPLIANT
+    return _PRIVACY_POLICY.get(level, _NO_POLICY)[1]
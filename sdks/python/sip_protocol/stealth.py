@@ -10,11 +10,16 @@ Stealth addresses provide unlinkable payments:
 3. Only recipient can derive the private key to spend
 """
 
-import hashlib
+import functools
 import secrets
-from typing import Tuple, Optional
+from dataclasses import dataclass
+from hashlib import sha256
+from typing import Callable, List, Optional, Sequence, Tuple
 
 from coincurve import PublicKey, PrivateKey
+from coincurve._libsecp256k1 import lib
+from coincurve.context import GLOBAL_CONTEXT
+from coincurve.utils import validate_secret
 from Crypto.Hash import keccak
 
 from .types import (
@@ -22,14 +27,22 @@ from .types import (
     ChainId,
     StealthMetaAddress,
     StealthAddress,
+    StealthAddressRaw,
     StealthAddressRecovery,
+    _SLOTS,
 )
 from .crypto import hex_to_bytes, bytes_to_hex
 
 
+# coincurve's shared libsecp256k1 context, for in-place point multiplication
+_CTX = GLOBAL_CONTEXT.ctx
+
 # secp256k1 curve order
 CURVE_ORDER = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
 
+# 0x01 in each byte of a 40-character address, for the EIP-55 checksum
+_BYTE_LOW_BITS = int.from_bytes(b"\x01" * 40, "big")
+
 
 def generate_stealth_meta_address(
     chain: ChainId, label: Optional[str] = None
@@ -94,42 +107,90 @@ def generate_stealth_address(
         >>> print(stealth.address)
         '0x02def...'
     """
+    raw, shared_secret_hash = generate_stealth_address_raw(recipient_meta_address)
+    return (stealth_address_from_raw(raw), bytes_to_hex(shared_secret_hash))
+
+
+def generate_stealth_address_raw(
+    recipient_meta_address: StealthMetaAddress,
+) -> Tuple[StealthAddressRaw, bytes]:
+    """
+    Generate a one-time stealth address, keeping the result as raw bytes.
+
+    Same protocol as generate_stealth_address, without hex-encoding the
+    address, ephemeral key and shared secret.
+
+    Args:
+        recipient_meta_address: The recipient's stealth meta-address
+
+    Returns:
+        Tuple of (raw stealth address, 32-byte shared secret hash)
+
+    Example:
+        >>> raw, secret = generate_stealth_address_raw(recipient_meta)
+        >>> stealth = stealth_address_from_raw(raw)
+    """
     # Generate ephemeral keypair
     ephemeral_private = secrets.token_bytes(32)
-    ephemeral_pub = PrivateKey(ephemeral_private).public_key.format(compressed=True)
+    ephemeral_pub = PublicKey.from_secret(ephemeral_private).format(compressed=True)
 
     # Parse recipient's keys
     spending_key_bytes = hex_to_bytes(recipient_meta_address.spending_key)
     viewing_key_bytes = hex_to_bytes(recipient_meta_address.viewing_key)
 
-    # Compute shared secret: S = r * P_spend
-    spending_point = PublicKey(spending_key_bytes)
-    shared_secret_point = spending_point.multiply(ephemeral_private)
-    shared_secret_bytes = shared_secret_point.format(compressed=True)
-
-    # Hash the shared secret for use as a scalar
-    shared_secret_hash = hashlib.sha256(shared_secret_bytes).digest()
+    # Compute and hash the shared secret: S = r * P_spend
+    shared_secret_hash = _shared_secret_hash(spending_key_bytes, ephemeral_private)
 
-    # Compute stealth address: A = Q_view + hash(S)*G
-    # hash(S)*G
+    # Compute stealth address: A = Q_view + hash(S)*G in one tweak_add
     hash_scalar = int.from_bytes(shared_secret_hash, "big") % CURVE_ORDER
-    hash_times_g = PrivateKey(hash_scalar.to_bytes(32, "big")).public_key
-
-    # Q_view + hash(S)*G
     viewing_point = PublicKey(viewing_key_bytes)
-    stealth_point = viewing_point.combine([hash_times_g])
-    stealth_address_bytes = stealth_point.format(compressed=True)
+    stealth_point = viewing_point.add(hash_scalar.to_bytes(32, "big"))
+
+    raw = StealthAddressRaw(
+        address=stealth_point.format(compressed=True),
+        ephemeral_public_key=ephemeral_pub,
+        # View tag (first byte of hash for efficient scanning)
+        view_tag=shared_secret_hash[0],
+    )
+
+    return (raw, shared_secret_hash)
 
-    # View tag (first byte of hash for efficient scanning)
-    view_tag = shared_secret_hash[0]
 
-    stealth_address = StealthAddress(
-        address=bytes_to_hex(stealth_address_bytes),
-        ephemeral_public_key=bytes_to_hex(ephemeral_pub),
-        view_tag=view_tag,
+def stealth_address_to_raw(stealth_address: StealthAddress) -> StealthAddressRaw:
+    """
+    Decode a StealthAddress's hex keys into a StealthAddressRaw.
+
+    Args:
+        stealth_address: The stealth address to convert
+
+    Returns:
+        The same stealth address with raw byte keys
+
+    Raises:
+        ValueError: If a key is not valid hex
+    """
+    return StealthAddressRaw(
+        address=hex_to_bytes(stealth_address.address),
+        ephemeral_public_key=hex_to_bytes(stealth_address.ephemeral_public_key),
+        view_tag=stealth_address.view_tag,
     )
 
-    return (stealth_address, bytes_to_hex(shared_secret_hash))
+
+def stealth_address_from_raw(raw: StealthAddressRaw) -> StealthAddress:
+    """
+    Encode a StealthAddressRaw's keys as hex for the public API.
+
+    Args:
+        raw: The raw stealth address to convert
+
+    Returns:
+        The same stealth address with hex keys
+    """
+    return StealthAddress(
+        address=bytes_to_hex(raw.address),
+        ephemeral_public_key=bytes_to_hex(raw.ephemeral_public_key),
+        view_tag=raw.view_tag,
+    )
 
 
 def derive_stealth_private_key(
@@ -160,13 +221,8 @@ def derive_stealth_private_key(
     viewing_priv_bytes = hex_to_bytes(viewing_private_key)
     ephemeral_pub_bytes = hex_to_bytes(stealth_address.ephemeral_public_key)
 
-    # Compute shared secret: S = p_spend * R_ephemeral
-    ephemeral_point = PublicKey(ephemeral_pub_bytes)
-    shared_secret_point = ephemeral_point.multiply(spending_priv_bytes)
-    shared_secret_bytes = shared_secret_point.format(compressed=True)
-
-    # Hash the shared secret
-    shared_secret_hash = hashlib.sha256(shared_secret_bytes).digest()
+    # Compute and hash the shared secret: S = p_spend * R_ephemeral
+    shared_secret_hash = _shared_secret_hash(ephemeral_pub_bytes, spending_priv_bytes)
 
     # Derive stealth private key: q_view + hash(S) mod n
     viewing_scalar = int.from_bytes(viewing_priv_bytes, "big")
@@ -182,6 +238,74 @@ def derive_stealth_private_key(
     )
 
 
+def _shared_secret_hash(public_key_bytes: bytes, private_key_bytes: bytes) -> bytes:
+    """
+    Compute hash(S) for the ECDH shared point S = private * public.
+
+    Used by both sides: S = p_spend * R_ephemeral for the recipient and
+    S = r * P_spend for the sender. This is the digest secp256k1_ecdh's
+    default hash function produces, but that constant-time path measures
+    ~20% slower than tweak_mul + serialize + SHA-256 in coincurve.
+    """
+    point = PublicKey(public_key_bytes)
+    return _shared_secret_hash_point(point, validate_secret(private_key_bytes))
+
+
+def _shared_secret_hash_point(ephemeral_point: PublicKey, spending_scalar: bytes) -> bytes:
+    """
+    Compute hash(S) for an already parsed ephemeral point, multiplying it in place.
+
+    spending_scalar must already be validated (32 bytes, 0 < s < n), so the
+    multiplication calls secp256k1_ec_pubkey_tweak_mul directly instead of
+    PublicKey.multiply, which re-validates the scalar and copies the point.
+    """
+    lib.secp256k1_ec_pubkey_tweak_mul(_CTX, ephemeral_point.public_key, spending_scalar)
+    return sha256(ephemeral_point.format(compressed=True)).digest()
+
+
+def _parse_ephemeral_point(ephemeral_pub_bytes: bytes) -> Optional[PublicKey]:
+    """Parse a candidate's ephemeral public key, or None if it is malformed."""
+    try:
+        return PublicKey(ephemeral_pub_bytes)
+    except Exception:
+        return None
+
+
+def _to_raw_or_none(stealth_address: StealthAddress) -> Optional[StealthAddressRaw]:
+    """Convert a candidate to raw form, or None if its hex is malformed."""
+    try:
+        return stealth_address_to_raw(stealth_address)
+    except ValueError:
+        return None
+
+
+def _view_tag_survivors(
+    digests: List[Optional[bytes]], view_tags: Sequence[int]
+) -> List[Tuple[int, bytes]]:
+    """(index, hash) pairs whose shared-secret hash starts with the announced view tag."""
+    return [
+        (i, digest)
+        for i, (digest, view_tag) in enumerate(zip(digests, view_tags))
+        if digest is not None and digest[0] == view_tag
+    ]
+
+
+def _is_expected_stealth_address(
+    address_bytes: bytes, viewing_scalar: int, shared_secret_hash: bytes
+) -> bool:
+    """Full verification: derive the expected stealth address and compare."""
+    hash_scalar = int.from_bytes(shared_secret_hash, "big")
+    stealth_private_scalar = (viewing_scalar + hash_scalar) % CURVE_ORDER
+
+    # Compute expected public key (a single fixed-base multiplication)
+    expected_pub = PublicKey.from_secret(
+        stealth_private_scalar.to_bytes(32, "big")
+    ).format(compressed=True)
+
+    # Compare with provided stealth address
+    return expected_pub == address_bytes
+
+
 def check_stealth_address(
     stealth_address: StealthAddress,
     spending_private_key: HexString,
@@ -204,39 +328,284 @@ def check_stealth_address(
         >>> is_mine = check_stealth_address(stealth, spending_priv, viewing_priv)
     """
     spending_priv_bytes = hex_to_bytes(spending_private_key)
-    viewing_priv_bytes = hex_to_bytes(viewing_private_key)
+    viewing_scalar = int.from_bytes(hex_to_bytes(viewing_private_key), "big")
     ephemeral_pub_bytes = hex_to_bytes(stealth_address.ephemeral_public_key)
 
     try:
         # Compute shared secret
-        ephemeral_point = PublicKey(ephemeral_pub_bytes)
-        shared_secret_point = ephemeral_point.multiply(spending_priv_bytes)
-        shared_secret_bytes = shared_secret_point.format(compressed=True)
-        shared_secret_hash = hashlib.sha256(shared_secret_bytes).digest()
+        shared_secret_hash = _shared_secret_hash(ephemeral_pub_bytes, spending_priv_bytes)
 
         # Quick view tag check
         if shared_secret_hash[0] != stealth_address.view_tag:
             return False
 
-        # Full verification: derive expected stealth address
-        viewing_scalar = int.from_bytes(viewing_priv_bytes, "big")
-        hash_scalar = int.from_bytes(shared_secret_hash, "big")
-        stealth_private_scalar = (viewing_scalar + hash_scalar) % CURVE_ORDER
-
-        # Compute expected public key
-        expected_pub = PrivateKey(
-            stealth_private_scalar.to_bytes(32, "big")
-        ).public_key.format(compressed=True)
-
-        # Compare with provided stealth address
-        provided_address = hex_to_bytes(stealth_address.address)
-        return expected_pub == provided_address
+        return _is_expected_stealth_address(
+            hex_to_bytes(stealth_address.address), viewing_scalar, shared_secret_hash
+        )
 
     except Exception:
         return False
 
 
-def public_key_to_eth_address(public_key: HexString) -> HexString:
+def check_stealth_addresses_batch(
+    stealth_addresses: List[StealthAddress],
+    spending_private_key: HexString,
+    viewing_private_key: HexString,
+) -> List[bool]:
+    """
+    Check which of a batch of stealth addresses belong to this recipient.
+
+    Recipient keys are parsed and validated once for the whole batch, and
+    every ephemeral key is parsed up front. Shared-secret hashes are then
+    computed for every candidate, the view tag filter runs over all of them
+    in a single pass, and full verification only runs for the survivors
+    (about 1 in 256 of the addresses that are not ours).
+
+    Args:
+        stealth_addresses: The stealth addresses to check (e.g. a block's announcements)
+        spending_private_key: Recipient's spending private key
+        viewing_private_key: Recipient's viewing private key
+
+    Returns:
+        List of booleans, True where the stealth address belongs to this recipient
+
+    Raises:
+        ValueError: If a key is not valid hex
+
+    Example:
+        >>> mine = check_stealth_addresses_batch(announcements, spending_priv, viewing_priv)
+        >>> owned = [s for s, is_mine in zip(announcements, mine) if is_mine]
+    """
+    # Malformed keys raise; an out-of-range spending key owns nothing, as in
+    # check_stealth_address
+    spending_scalar = int.from_bytes(hex_to_bytes(spending_private_key), "big")
+    if not 0 < spending_scalar < CURVE_ORDER:
+        return [False] * len(stealth_addresses)
+    return StealthScanner(spending_private_key, viewing_private_key).check_batch(
+        stealth_addresses
+    )
+
+
+@dataclass(frozen=True, **_SLOTS)
+class StealthAnnouncementBatch:
+    """
+    Announcements stored column-wise, for scanning large batches.
+
+    Instead of one StealthAddress object per announcement, each field is a
+    single contiguous buffer: entry i of the batch is
+    addresses[33*i : 33*i + 33], ephemeral_public_keys[33*i : 33*i + 33]
+    and view_tags[i].
+
+    Attributes:
+        addresses: Concatenated compressed stealth addresses (33 bytes each)
+        ephemeral_public_keys: Concatenated compressed ephemeral keys (33 bytes each)
+        view_tags: One view tag byte per announcement
+
+    Example:
+        >>> batch = StealthAnnouncementBatch.from_hex_list(announcements)
+        >>> mine = StealthScanner(spending_priv, viewing_priv).check_announcements(batch)
+    """
+
+    addresses: bytes
+    ephemeral_public_keys: bytes
+    view_tags: bytes
+
+    def __post_init__(self) -> None:
+        count = len(self.view_tags)
+        if len(self.addresses) != 33 * count or len(self.ephemeral_public_keys) != 33 * count:
+            raise ValueError("Address and ephemeral key buffers must hold 33 bytes per view tag")
+
+    def __len__(self) -> int:
+        return len(self.view_tags)
+
+    @classmethod
+    def from_hex_list(cls, stealth_addresses: List[StealthAddress]) -> "StealthAnnouncementBatch":
+        """
+        Build a batch from StealthAddress objects, decoding each column in one call.
+
+        Raises:
+            ValueError: If a key is not a 0x-prefixed 33-byte hex string or a
+                view tag is outside 0-255
+        """
+        for stealth_address in stealth_addresses:
+            if (
+                len(stealth_address.address) != 68
+                or len(stealth_address.ephemeral_public_key) != 68
+                or not stealth_address.address.startswith("0x")
+                or not stealth_address.ephemeral_public_key.startswith("0x")
+            ):
+                raise ValueError(f"Invalid stealth address encoding: {stealth_address}")
+        return cls(
+            addresses=hex_to_bytes("".join(s.address[2:] for s in stealth_addresses)),
+            ephemeral_public_keys=hex_to_bytes(
+                "".join(s.ephemeral_public_key[2:] for s in stealth_addresses)
+            ),
+            view_tags=bytes(s.view_tag for s in stealth_addresses),
+        )
+
+    @classmethod
+    def from_raw_list(
+        cls, stealth_addresses: List[StealthAddressRaw]
+    ) -> "StealthAnnouncementBatch":
+        """Build a batch from StealthAddressRaw objects."""
+        return cls(
+            addresses=b"".join(s.address for s in stealth_addresses),
+            ephemeral_public_keys=b"".join(s.ephemeral_public_key for s in stealth_addresses),
+            view_tags=bytes(s.view_tag for s in stealth_addresses),
+        )
+
+    def unpack(self, index: int) -> StealthAddress:
+        """Rebuild the StealthAddress at an index."""
+        return stealth_address_from_raw(self.unpack_raw(index))
+
+    def unpack_raw(self, index: int) -> StealthAddressRaw:
+        """Rebuild the StealthAddressRaw at an index."""
+        # Indexing a range bounds-checks and normalizes negative indices
+        start = 33 * range(len(self))[index]
+        return StealthAddressRaw(
+            address=self.addresses[start : start + 33],
+            ephemeral_public_key=self.ephemeral_public_keys[start : start + 33],
+            view_tag=self.view_tags[index],
+        )
+
+
+class StealthScanner:
+    """
+    Scans stealth addresses for one recipient, parsing the keys only once.
+
+    Use this instead of check_stealth_address when scanning many
+    announcements: both keys are parsed once, and the spending scalar is
+    validated once and then multiplied into each ephemeral point with no
+    further checks.
+
+    Args:
+        spending_private_key: Recipient's spending private key
+        viewing_private_key: Recipient's viewing private key
+
+    Raises:
+        ValueError: If either key is malformed or the spending key is out of range
+
+    Example:
+        >>> scanner = StealthScanner(spending_priv, viewing_priv)
+        >>> owned = [s for s in announcements if scanner.check(s)]
+        >>> recovery = scanner.derive_private_key(owned[0])
+    """
+
+    def __init__(
+        self, spending_private_key: HexString, viewing_private_key: HexString
+    ) -> None:
+        self._spending_scalar = validate_secret(hex_to_bytes(spending_private_key))
+        self._viewing_priv_scalar = int.from_bytes(hex_to_bytes(viewing_private_key), "big")
+
+    def _shared_secret_hash(self, ephemeral_pub_bytes: bytes) -> bytes:
+        return _shared_secret_hash_point(PublicKey(ephemeral_pub_bytes), self._spending_scalar)
+
+    def check(self, stealth_address: StealthAddress) -> bool:
+        """Check if a stealth address belongs to this recipient."""
+        raw = _to_raw_or_none(stealth_address)
+        return raw is not None and self.check_raw(raw)
+
+    def check_raw(self, stealth_address: StealthAddressRaw) -> bool:
+        """Check a raw stealth address, without any hex parsing."""
+        try:
+            shared_secret_hash = self._shared_secret_hash(stealth_address.ephemeral_public_key)
+            if shared_secret_hash[0] != stealth_address.view_tag:
+                return False
+            return _is_expected_stealth_address(
+                stealth_address.address, self._viewing_priv_scalar, shared_secret_hash
+            )
+        except Exception:
+            return False
+
+    def check_batch(self, stealth_addresses: List[StealthAddress]) -> List[bool]:
+        """Check a batch of stealth addresses, see check_stealth_addresses_batch."""
+        return self._check_raw_batch([_to_raw_or_none(s) for s in stealth_addresses])
+
+    def check_raw_batch(self, stealth_addresses: List[StealthAddressRaw]) -> List[bool]:
+        """Check a batch of raw stealth addresses, without any hex parsing."""
+        return self._check_raw_batch(stealth_addresses)
+
+    def check_announcements(self, batch: StealthAnnouncementBatch) -> List[bool]:
+        """Check a column-wise announcement batch, see StealthAnnouncementBatch."""
+        spending_scalar = self._spending_scalar
+        ephemeral_keys = batch.ephemeral_public_keys
+        addresses = batch.addresses
+
+        # Stages 1 and 2: parse each ephemeral point and hash its shared secret
+        digests = []
+        for start in range(0, len(ephemeral_keys), 33):
+            point = _parse_ephemeral_point(ephemeral_keys[start : start + 33])
+            digests.append(
+                None if point is None else _shared_secret_hash_point(point, spending_scalar)
+            )
+
+        # Stage 3: view tag filter straight over the view tag column
+        survivors = _view_tag_survivors(digests, batch.view_tags)
+
+        # Stage 4: full verification of survivors
+        return self._verify_survivors(
+            survivors, lambda i: addresses[33 * i : 33 * i + 33], len(digests)
+        )
+
+    def _check_raw_batch(
+        self, stealth_addresses: Sequence[Optional[StealthAddressRaw]]
+    ) -> List[bool]:
+        spending_scalar = self._spending_scalar
+
+        # Stage 1: parse every ephemeral point
+        ephemeral_points = [
+            None if s is None else _parse_ephemeral_point(s.ephemeral_public_key)
+            for s in stealth_addresses
+        ]
+
+        # Stage 2: shared-secret hashes for every parsed candidate
+        digests = [
+            None if point is None else _shared_secret_hash_point(point, spending_scalar)
+            for point in ephemeral_points
+        ]
+
+        # Stage 3: view tag filter in one pass
+        view_tags = [-1 if s is None else s.view_tag for s in stealth_addresses]
+        survivors = _view_tag_survivors(digests, view_tags)
+
+        # Stage 4: full verification of survivors (None entries never survive)
+        addresses = [b"" if s is None else s.address for s in stealth_addresses]
+        return self._verify_survivors(survivors, lambda i: addresses[i], len(digests))
+
+    def _verify_survivors(
+        self,
+        survivors: List[Tuple[int, bytes]],
+        address_at: Callable[[int], bytes],
+        count: int,
+    ) -> List[bool]:
+        """Fully verify the view-tag survivors; every other index is False."""
+        results = [False] * count
+        for i, digest in survivors:
+            try:
+                results[i] = _is_expected_stealth_address(
+                    address_at(i), self._viewing_priv_scalar, digest
+                )
+            except Exception:
+                pass
+        return results
+
+    def derive_private_key(self, stealth_address: StealthAddress) -> StealthAddressRecovery:
+        """Derive the private key for a stealth address, see derive_stealth_private_key."""
+        ephemeral_pub_bytes = hex_to_bytes(stealth_address.ephemeral_public_key)
+        shared_secret_hash = self._shared_secret_hash(ephemeral_pub_bytes)
+        hash_scalar = int.from_bytes(shared_secret_hash, "big")
+        stealth_private_scalar = (self._viewing_priv_scalar + hash_scalar) % CURVE_ORDER
+
+        return StealthAddressRecovery(
+            stealth_address=stealth_address.address,
+            ephemeral_public_key=stealth_address.ephemeral_public_key,
+            private_key=bytes_to_hex(stealth_private_scalar.to_bytes(32, "big")),
+        )
+
+
+def public_key_to_eth_address(
+    public_key: HexString, uncompressed_hint: Optional[bytes] = None
+) -> HexString:
     """
     Convert a secp256k1 public key to an Ethereum address.
 
@@ -249,10 +618,16 @@ def public_key_to_eth_address(public_key: HexString) -> HexString:
 
     Args:
         public_key: Compressed or uncompressed secp256k1 public key
+        uncompressed_hint: The same key already in uncompressed form (65 bytes,
+            0x04 prefix), for callers that have it, to skip decompression.
+            It is checked against ``public_key`` (x-coordinate and y parity)
 
     Returns:
         Checksummed Ethereum address
 
+    Raises:
+        ValueError: If the key is malformed or the hint is for a different key
+
     Example:
         >>> eth_addr = public_key_to_eth_address(stealth.address)
         >>> print(eth_addr)
@@ -260,10 +635,24 @@ def public_key_to_eth_address(public_key: HexString) -> HexString:
     """
     key_bytes = hex_to_bytes(public_key)
 
+    if uncompressed_hint is not None:
+        if len(uncompressed_hint) != 65 or uncompressed_hint[0] != 0x04:
+            raise ValueError("uncompressed_hint must be a 65-byte 0x04-prefixed key")
+        # Same x-coordinate and y parity as public_key; no square root needed
+        if len(key_bytes) == 33:
+            matches = (
+                key_bytes[1:] == uncompressed_hint[1:33]
+                and key_bytes[0] == 0x02 + (uncompressed_hint[64] & 1)
+            )
+        else:
+            matches = key_bytes == uncompressed_hint
+        if not matches:
+            raise ValueError("uncompressed_hint does not match public_key")
+        key_bytes = uncompressed_hint
+
     # Decompress if needed
     if len(key_bytes) == 33:
-        point = PublicKey(key_bytes)
-        key_bytes = point.format(compressed=False)
+        key_bytes = _decompress(key_bytes)
     elif len(key_bytes) != 65:
         raise ValueError(f"Invalid public key length: {len(key_bytes)}")
 
@@ -275,21 +664,35 @@ def public_key_to_eth_address(public_key: HexString) -> HexString:
 
     # Take last 20 bytes
     address_bytes = address_hash[-20:]
-    address_hex = address_bytes.hex()
 
     # Apply EIP-55 checksum
+    return HexString("0x" + _eip55_checksum(address_bytes.hex()))
+
+
+@functools.lru_cache(maxsize=4096)
+def _decompress(public_key_bytes: bytes) -> bytes:
+    """Uncompressed (65-byte) form of a compressed public key, cached for recurring keys."""
+    return PublicKey(public_key_bytes).format(compressed=False)
+
+
+def _eip55_checksum(address_hex: str) -> str:
+    """
+    Apply the EIP-55 mixed-case checksum to a 40-char lowercase hex address.
+
+    All 40 characters are processed at once as one big integer of ASCII
+    bytes: a letter is uppercased (bit 0x20 cleared) when the matching
+    checksum hex digit is >= 8, i.e. '8', '9' or 'a'-'f' (bit 0x08 or 0x40 set).
+    """
     h = keccak.new(digest_bits=256)
     h.update(address_hex.encode("ascii"))
-    checksum_hash = h.hexdigest()
+    checksum_hash = h.hexdigest()[:40]
 
-    checksummed = ""
-    for i, char in enumerate(address_hex):
-        if char in "0123456789":
-            checksummed += char
-        else:
-            checksummed += char.upper() if int(checksum_hash[i], 16) >= 8 else char.lower()
+    chars = int.from_bytes(address_hex.encode("ascii"), "big")
+    digits = int.from_bytes(checksum_hash.encode("ascii"), "big")
 
-    return HexString(f"0x{checksummed}")
+    # 0x20 in every byte whose checksum digit is >= 8 and whose character is a letter
+    upper = (((digits >> 3) | (digits >> 6)) & _BYTE_LOW_BITS) * 0x20 & (chars >> 1)
+    return (chars ^ upper).to_bytes(40, "big").decode("ascii")
 
 
 def encode_stealth_meta_address(meta_address: StealthMetaAddress) -> str:
@@ -325,12 +728,16 @@ def decode_stealth_meta_address(encoded: str) -> StealthMetaAddress:
     Raises:
         ValueError: If the format is invalid
     """
-    parts = encoded.split(":")
-    if len(parts) != 4 or parts[0] != "sip":
+    # Bounded parse: partition never builds a list of every colon-separated field
+    if not encoded.startswith("sip:"):
+        raise ValueError(f"Invalid stealth meta-address format: {encoded}")
+    chain, _, keys = encoded[4:].partition(":")
+    spending_key, _, viewing_key = keys.partition(":")
+    if not chain or not spending_key or not viewing_key or ":" in viewing_key:
         raise ValueError(f"Invalid stealth meta-address format: {encoded}")
 
     return StealthMetaAddress(
-        chain=ChainId(parts[1]),
-        spending_key=HexString(parts[2]),
-        viewing_key=HexString(parts[3]),
+        chain=ChainId(chain),
+        spending_key=HexString(spending_key),
+        viewing_key=HexString(viewing_key),
     )
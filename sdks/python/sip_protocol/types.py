@@ -4,10 +4,15 @@ Type definitions for SIP Protocol Python SDK.
 These types mirror the TypeScript definitions in @sip-protocol/types.
 """
 
+import sys
 from dataclasses import dataclass
 from enum import Enum
 from typing import NewType, Optional
 
+# These are created per scanned announcement / commitment, so drop the
+# per-instance __dict__ where dataclasses support it (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 # Type aliases
 HexString = NewType("HexString", str)
 """A hex string with 0x prefix (e.g., '0x1234abcd')"""
@@ -19,7 +24,7 @@ Hash = NewType("Hash", str)
 """A 32-byte hash as hex string with 0x prefix"""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class StealthMetaAddress:
     """
     A stealth meta-address containing public keys for generating one-time addresses.
@@ -37,7 +42,7 @@ class StealthMetaAddress:
     label: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class StealthAddress:
     """
     A one-time stealth address derived from a meta-address.
@@ -53,7 +58,23 @@ class StealthAddress:
     view_tag: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
+class StealthAddressRaw:
+    """
+    A StealthAddress with its keys kept as raw bytes, for scanning pipelines.
+
+    Attributes:
+        address: The stealth address (compressed public key, 33 bytes)
+        ephemeral_public_key: The sender's ephemeral public key (33 bytes)
+        view_tag: First byte of shared secret hash for efficient scanning
+    """
+
+    address: bytes
+    ephemeral_public_key: bytes
+    view_tag: int
+
+
+@dataclass(frozen=True, **_SLOTS)
 class StealthAddressRecovery:
     """
     Recovery data for spending from a stealth address.
@@ -69,7 +90,7 @@ class StealthAddressRecovery:
     private_key: HexString
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class PedersenCommitment:
     """
     A Pedersen commitment with its blinding factor.
@@ -88,7 +109,7 @@ class PedersenCommitment:
     blinding: HexString
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class ViewingKey:
     """
     A viewing key for selective disclosure.
@@ -121,7 +142,7 @@ class PrivacyLevel(str, Enum):
     COMPLIANT = "compliant"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class EncryptedPayload:
     """
     Encrypted data with nonce for decryption.
@@ -17,6 +17,23 @@ class TestCrypto:
         assert result.startswith("0x")
         assert len(result) == 66  # 0x + 64 hex chars
 
+    def test_hash_sha256_raw(self):
+        from sip_protocol import hash_sha256, hash_sha256_raw
+
+        raw = hash_sha256_raw("hello")
+        assert len(raw) == 32
+        assert "0x" + raw.hex() == hash_sha256("hello")
+        assert hash_sha256_raw(b"hello") == raw
+
+    def test_hex_to_bytes(self):
+        from sip_protocol.crypto import hex_to_bytes
+
+        assert hex_to_bytes("0xabcd") == b"\xab\xcd"
+        assert hex_to_bytes("abcd") == b"\xab\xcd"
+        for bad in ("0xabc", "0xzz"):
+            with pytest.raises(ValueError):
+                hex_to_bytes(bad)
+
     def test_generate_random_bytes(self):
         from sip_protocol import generate_random_bytes
 
@@ -52,6 +69,157 @@ class TestCommitment:
         # Should fail with wrong value
         assert not verify_opening(commitment, 101, blinding)
 
+    def test_commit_known_vector(self):
+        from sip_protocol import commit, commit_zero
+
+        blinding = bytes(range(1, 33))
+
+        commitment, _ = commit(100, blinding)
+        assert commitment == (
+            "0x02562625a0b738bc12d9774b4843a686815a1b10edca1f0ff775f058f984026ce3"
+        )
+
+        zero_commitment, _ = commit_zero(blinding)
+        assert zero_commitment == (
+            "0x03209991b508b07fa03b71f65de5ee511472cd37aa3f42daf11120a3552f2ec19a"
+        )
+
+    def test_commit_batch(self):
+        from sip_protocol import commit_batch, generate_blindings, verify_openings_batch
+
+        values = [0, 1, 100]
+        openings = commit_batch(values)
+        assert len(openings) == 3
+        assert verify_openings_batch(
+            [c for c, _ in openings], values, [b for _, b in openings]
+        )
+
+        blindings = generate_blindings(4)
+        assert len(blindings) == 4
+        assert len(set(blindings)) == 4
+        assert all(len(b) == 66 for b in blindings)
+
+    def test_make_commit_for_value(self):
+        from sip_protocol import commit, make_commit_for_value, verify_opening
+
+        blinding = bytes(range(1, 33))
+        commit_100 = make_commit_for_value(100)
+
+        assert commit_100(blinding) == commit(100, blinding)
+
+        commitment, random_blinding = commit_100()
+        assert verify_opening(commitment, 100, random_blinding)
+
+        assert make_commit_for_value(0)(blinding) == commit(0, blinding)
+
+        with pytest.raises(ValueError):
+            make_commit_for_value(-1)
+
+    def test_verify_openings_batch(self):
+        from sip_protocol import commit, verify_openings_batch
+
+        openings = [commit(v) for v in (1, 10, 100)]
+        commitments = [c for c, _ in openings]
+        blindings = [b for _, b in openings]
+
+        assert verify_openings_batch(commitments, [1, 10, 100], blindings)
+        assert not verify_openings_batch(commitments, [1, 10, 101], blindings)
+        assert verify_openings_batch([], [], [])
+
+        with pytest.raises(ValueError):
+            verify_openings_batch(commitments, [1, 10], blindings)
+
+    def test_verify_zero_opening_rejected(self):
+        from sip_protocol import commit, verify_opening, verify_openings_batch
+        from sip_protocol.commitment import CURVE_ORDER
+
+        # value 0 with r = 0 (or r = n) sums to infinity and must not reach libsecp256k1
+        c, _ = commit(1)
+        for blinding in ("0x" + "00" * 32, "0x" + CURVE_ORDER.to_bytes(32, "big").hex()):
+            assert not verify_opening(c, 0, blinding)
+            assert not verify_openings_batch([c], [0], [blinding])
+
+    def test_commit_does_not_use_h_table(self, monkeypatch):
+        from sip_protocol import commitment
+
+        blinding = bytes(range(1, 33))
+        r_scalar = int.from_bytes(blinding, "big")
+        expected = [commitment._opening_point(v, r_scalar) for v in (0, 100)]
+
+        def no_table(scalar):
+            raise AssertionError("H table lookup indexed by a secret blinding")
+
+        monkeypatch.setattr(commitment, "_h_multiples", no_table)
+        assert [
+            commitment._commit_point(commitment._value_term(v), r_scalar) for v in (0, 100)
+        ] == expected
+        assert commitment.commit(100, blinding)[0] == "0x" + expected[1].hex()
+        assert commitment.make_commit_for_value(0)(blinding)[0] == "0x" + expected[0].hex()
+        commitment.commit_batch([1, 2])
+
+    def test_h_table_threaded_first_use(self, monkeypatch):
+        import threading
+
+        from sip_protocol import commitment
+
+        r_scalar = int.from_bytes(bytes(range(1, 33)), "big")
+        expected = commitment._opening_point(100, r_scalar)
+
+        builds = []
+        build_h_table = commitment._build_h_table
+
+        def counting_build():
+            builds.append(1)
+            return build_h_table()
+
+        monkeypatch.setattr(commitment, "_h_table", None)
+        monkeypatch.setattr(commitment, "_build_h_table", counting_build)
+
+        barrier = threading.Barrier(8)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(commitment._opening_point(100, r_scalar))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [expected] * 8
+        assert len(builds) == 1
+
+    def test_blinding_arithmetic_rejects_malformed_hex(self):
+        from sip_protocol import add_blindings, subtract_blindings
+
+        for bad in ("-0x01", " 0x01 ", "0x_0_1"):
+            with pytest.raises(ValueError):
+                add_blindings(bad, "0x02")
+            with pytest.raises(ValueError):
+                subtract_blindings("0x02", bad)
+
+    def test_generator_h_matches_derivation(self):
+        from sip_protocol.commitment import _H_BYTES, _generate_h
+
+        assert _generate_h() == _H_BYTES
+
+    def test_get_generators(self):
+        from sip_protocol import get_generators
+
+        generators = get_generators()
+        assert generators["G"]["x"] == (
+            "0x79be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798"
+        )
+        assert generators["H"]["x"] == (
+            "0xa4d34f1618b24211ad9aa88d137b4103f30aa66599e018efd6d6d6add211a34a"
+        )
+
+        # Callers get their own copy
+        generators["G"]["x"] = "0x00"
+        assert get_generators()["G"]["x"] != "0x00"
+
     def test_homomorphic_addition(self):
         from sip_protocol import commit, add_commitments, add_blindings, verify_opening
 
@@ -64,6 +232,23 @@ class TestCommitment:
         # Sum should verify to 150
         assert verify_opening(c_sum, 150, b_sum)
 
+    def test_homomorphic_subtraction(self):
+        from sip_protocol import (
+            commit,
+            subtract_commitments,
+            subtract_blindings,
+            verify_opening,
+        )
+
+        c1, b1 = commit(100)
+        c2, b2 = commit(30)
+
+        c_diff = subtract_commitments(c1, c2)
+        b_diff = subtract_blindings(b1, b2)
+
+        # Difference should verify to 70
+        assert verify_opening(c_diff, 70, b_diff)
+
 
 class TestStealth:
     """Tests for stealth addresses."""
@@ -102,6 +287,127 @@ class TestStealth:
         # Should recognize own address
         assert check_stealth_address(stealth, spending_priv, viewing_priv)
 
+        # Malformed recipient keys are errors, not "not mine"
+        with pytest.raises(ValueError):
+            check_stealth_address(stealth, spending_priv, "0xnot-hex")
+        with pytest.raises(ValueError):
+            check_stealth_address(stealth, "0xnot-hex", viewing_priv)
+
+    def test_check_stealth_addresses_batch(self):
+        from sip_protocol import (
+            StealthAddress,
+            generate_stealth_meta_address,
+            generate_stealth_address,
+            check_stealth_addresses_batch,
+        )
+
+        meta, spending_priv, viewing_priv = generate_stealth_meta_address("ethereum")
+        other_meta, _, _ = generate_stealth_meta_address("ethereum")
+
+        mine, _ = generate_stealth_address(meta)
+        not_mine, _ = generate_stealth_address(other_meta)
+        invalid = StealthAddress(
+            address=mine.address, ephemeral_public_key="0x00", view_tag=mine.view_tag
+        )
+
+        results = check_stealth_addresses_batch(
+            [mine, not_mine, invalid, mine], spending_priv, viewing_priv
+        )
+        assert results == [True, False, False, True]
+        assert check_stealth_addresses_batch([], spending_priv, viewing_priv) == []
+        assert check_stealth_addresses_batch(
+            [mine], "0x" + "00" * 32, viewing_priv
+        ) == [False]
+
+        # Malformed recipient keys raise, as they do for StealthScanner
+        with pytest.raises(ValueError):
+            check_stealth_addresses_batch([mine], "0xnot-hex", viewing_priv)
+        with pytest.raises(ValueError):
+            check_stealth_addresses_batch([mine], spending_priv, "0xnot-hex")
+
+    def test_stealth_scanner(self):
+        from sip_protocol import (
+            StealthScanner,
+            generate_stealth_meta_address,
+            generate_stealth_address,
+            derive_stealth_private_key,
+        )
+
+        meta, spending_priv, viewing_priv = generate_stealth_meta_address("ethereum")
+        other_meta, _, _ = generate_stealth_meta_address("ethereum")
+        mine, _ = generate_stealth_address(meta)
+        not_mine, _ = generate_stealth_address(other_meta)
+
+        scanner = StealthScanner(spending_priv, viewing_priv)
+        assert scanner.check(mine)
+        assert not scanner.check(not_mine)
+        assert scanner.check_batch([not_mine, mine]) == [False, True]
+        assert scanner.derive_private_key(mine) == derive_stealth_private_key(
+            mine, spending_priv, viewing_priv
+        )
+
+        with pytest.raises(ValueError):
+            StealthScanner("0x" + "00" * 32, viewing_priv)
+
+    def test_stealth_address_raw(self):
+        from sip_protocol import (
+            StealthScanner,
+            generate_stealth_meta_address,
+            generate_stealth_address_raw,
+            stealth_address_to_raw,
+            stealth_address_from_raw,
+            check_stealth_address,
+        )
+
+        meta, spending_priv, viewing_priv = generate_stealth_meta_address("ethereum")
+        raw, shared_secret = generate_stealth_address_raw(meta)
+        assert len(raw.address) == 33
+        assert len(raw.ephemeral_public_key) == 33
+        assert raw.view_tag == shared_secret[0]
+
+        stealth = stealth_address_from_raw(raw)
+        assert stealth_address_to_raw(stealth) == raw
+        assert check_stealth_address(stealth, spending_priv, viewing_priv)
+
+        scanner = StealthScanner(spending_priv, viewing_priv)
+        assert scanner.check_raw(raw)
+        assert scanner.check_raw_batch([raw, raw]) == [True, True]
+
+    def test_stealth_announcement_batch(self):
+        from sip_protocol import (
+            StealthAddress,
+            StealthAnnouncementBatch,
+            StealthScanner,
+            generate_stealth_meta_address,
+            generate_stealth_address,
+            stealth_address_to_raw,
+        )
+
+        meta, spending_priv, viewing_priv = generate_stealth_meta_address("ethereum")
+        other_meta, _, _ = generate_stealth_meta_address("ethereum")
+        announcements = [
+            generate_stealth_address(meta)[0],
+            generate_stealth_address(other_meta)[0],
+            generate_stealth_address(meta)[0],
+        ]
+
+        batch = StealthAnnouncementBatch.from_hex_list(announcements)
+        assert len(batch) == 3
+        assert batch.unpack(1) == announcements[1]
+        assert batch.unpack(-1) == announcements[2]
+        assert StealthAnnouncementBatch.from_raw_list(
+            [stealth_address_to_raw(s) for s in announcements]
+        ) == batch
+
+        scanner = StealthScanner(spending_priv, viewing_priv)
+        assert scanner.check_announcements(batch) == [True, False, True]
+        assert scanner.check_announcements(StealthAnnouncementBatch.from_hex_list([])) == []
+
+        with pytest.raises(ValueError):
+            StealthAnnouncementBatch.from_hex_list(
+                [StealthAddress(address="0x02", ephemeral_public_key="0x03", view_tag=1)]
+            )
+
     def test_derive_stealth_private_key(self):
         from sip_protocol import (
             generate_stealth_meta_address,
@@ -117,6 +423,78 @@ class TestStealth:
         assert recovery.stealth_address == stealth.address
         assert recovery.private_key.startswith("0x")
 
+    def test_stealth_known_vector(self):
+        from unittest import mock
+
+        from coincurve import PublicKey
+
+        from sip_protocol import (
+            StealthMetaAddress,
+            generate_stealth_address,
+            derive_stealth_private_key,
+            check_stealth_address,
+            public_key_to_eth_address,
+        )
+
+        meta = StealthMetaAddress(
+            spending_key="0x034f355bdcb7cc0af728ef3cceb9615d90684bb5b2ca5f859ab0f0b704075871aa",
+            viewing_key="0x02466d7fcae563e5cb09a0d1870bb580344804617879a14949cf22285f1bae3f27",
+            chain="ethereum",
+        )
+        spending_priv = "0x" + "11" * 32
+        viewing_priv = "0x" + "22" * 32
+
+        with mock.patch("sip_protocol.stealth.secrets.token_bytes", return_value=b"\x33" * 32):
+            stealth, shared_secret = generate_stealth_address(meta)
+
+        assert stealth.address == (
+            "0x028acfb261b0be467830ea936c69ae1b6e18a4f36bc9ff3a5b53905b1872997dee"
+        )
+        assert stealth.ephemeral_public_key == (
+            "0x023c72addb4fdf09af94f0c94d7fe92a386a7e70cf8a1d85916386bb2535c7b1b1"
+        )
+        assert stealth.view_tag == 223
+        assert shared_secret == (
+            "0xdfe304e8d75b02eb65e2dab39393c34c0e81df962f6556a88e1417b4e4cd7acb"
+        )
+
+        recovery = derive_stealth_private_key(stealth, spending_priv, viewing_priv)
+        assert recovery.private_key == (
+            "0x0205270af97d250d8804fcd5b5b5e56f75f524d1a23ed88ef063db4a36b95bac"
+        )
+
+        assert check_stealth_address(stealth, spending_priv, viewing_priv)
+        assert not check_stealth_address(stealth, viewing_priv, spending_priv)
+        assert public_key_to_eth_address(stealth.address) == (
+            "0xB64DeF144d2Bf5960F785484F178875b2D4Bb473"
+        )
+        uncompressed = PublicKey(bytes.fromhex(stealth.address[2:])).format(compressed=False)
+        assert public_key_to_eth_address(
+            stealth.address, uncompressed_hint=uncompressed
+        ) == "0xB64DeF144d2Bf5960F785484F178875b2D4Bb473"
+        assert public_key_to_eth_address(
+            "0x" + uncompressed.hex(), uncompressed_hint=uncompressed
+        ) == "0xB64DeF144d2Bf5960F785484F178875b2D4Bb473"
+
+        # A hint for a different key, or with the other y, must not be trusted
+        other = PublicKey(bytes.fromhex(meta.spending_key[2:])).format(compressed=False)
+        odd_y = uncompressed[:64] + bytes([uncompressed[64] ^ 1])
+        for bad_hint in (uncompressed[:64], b"\x02" + uncompressed[1:], other, odd_y):
+            with pytest.raises(ValueError):
+                public_key_to_eth_address(stealth.address, uncompressed_hint=bad_hint)
+
+    def test_eip55_checksum_vectors(self):
+        from sip_protocol.stealth import _eip55_checksum
+
+        # Test vectors from the EIP-55 specification
+        for address in (
+            "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed",
+            "0xfB6916095ca1df60bB79Ce92cE3Ea74c37c5d359",
+            "0xdbF03B407c01E7cD3CBea99509d93f8DDDC8C6FB",
+            "0xD1220A0cf47c7B9Be7A2E6BA89F429762e7b9aDb",
+        ):
+            assert "0x" + _eip55_checksum(address[2:].lower()) == address
+
     def test_encode_decode_meta_address(self):
         from sip_protocol import (
             generate_stealth_meta_address,
@@ -134,6 +512,14 @@ class TestStealth:
         assert decoded.spending_key == meta.spending_key
         assert decoded.viewing_key == meta.viewing_key
 
+    def test_decode_meta_address_rejects_malformed(self):
+        from sip_protocol import decode_stealth_meta_address
+
+        for bad in ("sip:ethereum:0x02", "sop:ethereum:0x02:0x03", "sip:ethereum:0x02:0x03:x",
+                    "sip::0x02:0x03", "sip:ethereum::0x03"):
+            with pytest.raises(ValueError):
+                decode_stealth_meta_address(bad)
+
 
 class TestPrivacy:
     """Tests for viewing keys and encryption."""
@@ -148,6 +534,21 @@ class TestPrivacy:
         assert vk.label == "test-label"
         assert vk.created_at > 0
 
+    def test_generate_viewing_keys(self):
+        import time
+
+        from sip_protocol import generate_viewing_keys, derive_viewing_key_hash
+
+        before = time.time_ns() // 1_000_000
+        keys = generate_viewing_keys(3, "auditors")
+        assert len(keys) == 3
+        assert len({vk.key for vk in keys}) == 3
+        for vk in keys:
+            assert vk.key_hash == derive_viewing_key_hash(vk.key)
+            assert vk.label == "auditors"
+            assert before <= vk.created_at <= time.time_ns() // 1_000_000
+        assert generate_viewing_keys(0) == []
+
     def test_derive_viewing_key_hash(self):
         from sip_protocol import generate_viewing_key, derive_viewing_key_hash
 
@@ -173,6 +574,88 @@ class TestPrivacy:
         decrypted = decrypt_with_viewing_key(vk.key, payload)
         assert decrypted == plaintext
 
+    def test_encrypt_known_vector(self):
+        """Ciphertext format is fixed whichever AEAD backend is installed."""
+        from unittest import mock
+
+        from sip_protocol import encrypt_for_viewing_key, decrypt_with_viewing_key
+        from sip_protocol.types import EncryptedPayload
+
+        key = "0x" + "42" * 32
+        with mock.patch(
+            "sip_protocol.privacy.secrets.token_bytes", return_value=bytes(range(24))
+        ):
+            payload = encrypt_for_viewing_key(key, b"sip audit record")
+
+        assert payload.nonce == "0x000102030405060708090a0b0c0d0e0f1011121314151617"
+        assert payload.ciphertext == (
+            "0xff95f4c7a6d4a3a98646d62361578cda36a3f502a8803460602b08c82b094859"
+        )
+
+        tampered = EncryptedPayload(
+            ciphertext=payload.ciphertext[:-2] + "00", nonce=payload.nonce
+        )
+        with pytest.raises(ValueError, match="Decryption failed"):
+            decrypt_with_viewing_key(key, tampered)
+
+    def test_aead_pycryptodome_fallback(self, monkeypatch):
+        from sip_protocol import privacy
+
+        monkeypatch.setattr(privacy, "_sodium_encrypt", None)
+        monkeypatch.setattr(privacy, "_sodium_decrypt", None)
+
+        key = b"\x42" * 32
+        ciphertext = privacy._aead_encrypt(key, bytes(range(24)), b"sip audit record")
+        assert ciphertext.hex() == (
+            "ff95f4c7a6d4a3a98646d62361578cda36a3f502a8803460602b08c82b094859"
+        )
+        assert privacy._aead_decrypt(key, bytes(range(24)), ciphertext) == b"sip audit record"
+        with pytest.raises(ValueError, match="Decryption failed"):
+            privacy._aead_decrypt(key, bytes(range(24)), ciphertext[:-1] + b"\x00")
+
+    def test_aead_sodium_matches_pycryptodome(self, monkeypatch):
+        pytest.importorskip("nacl")
+        from sip_protocol import privacy
+
+        assert privacy._sodium_encrypt is not None
+        key = b"\x42" * 32
+        nonce = bytes(range(24))
+        plaintext = b"sip audit record" * 5
+
+        sodium_ciphertext = privacy._aead_encrypt(key, nonce, plaintext)
+        # Tampered, and shorter than the 16-byte tag
+        bad_inputs = (sodium_ciphertext[:-1] + b"\x00", sodium_ciphertext[:15], b"")
+        for bad in bad_inputs:
+            with pytest.raises(ValueError, match="Decryption failed"):
+                privacy._aead_decrypt(key, nonce, bad)
+
+        monkeypatch.setattr(privacy, "_sodium_encrypt", None)
+        monkeypatch.setattr(privacy, "_sodium_decrypt", None)
+        assert privacy._aead_encrypt(key, nonce, plaintext) == sodium_ciphertext
+        assert privacy._aead_decrypt(key, nonce, sodium_ciphertext) == plaintext
+        for bad in bad_inputs:
+            with pytest.raises(ValueError, match="Decryption failed"):
+                privacy._aead_decrypt(key, nonce, bad)
+
+
+class TestTypes:
+    """Tests for SDK data types."""
+
+    def test_types_are_frozen_and_slotted(self):
+        import dataclasses
+        import sys
+
+        from sip_protocol import StealthAddress, StealthAnnouncementBatch
+
+        stealth = StealthAddress(address="0x02", ephemeral_public_key="0x03", view_tag=7)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            stealth.view_tag = 8
+        assert dataclasses.replace(stealth, view_tag=8).view_tag == 8
+        batch = StealthAnnouncementBatch(b"", b"", b"")
+        if sys.version_info >= (3, 10):
+            assert not hasattr(stealth, "__dict__")
+            assert not hasattr(batch, "__dict__")
+
 
 class TestPrivacyLevel:
     """Tests for privacy levels."""
@@ -183,3 +666,62 @@ class TestPrivacyLevel:
         assert PrivacyLevel.TRANSPARENT.value == "transparent"
         assert PrivacyLevel.SHIELDED.value == "shielded"
         assert PrivacyLevel.COMPLIANT.value == "compliant"
+
+    def test_privacy_level_routing(self):
+        from sip_protocol import PrivacyLevel
+        from sip_protocol.privacy import (
+            validate_privacy_level,
+            should_encrypt,
+            should_include_viewing_key,
+        )
+
+        assert validate_privacy_level("shielded") is PrivacyLevel.SHIELDED
+        assert validate_privacy_level("Compliant") is PrivacyLevel.COMPLIANT
+        with pytest.raises(ValueError, match="Invalid privacy level"):
+            validate_privacy_level("private")
+
+        assert [should_encrypt(level) for level in PrivacyLevel] == [False, True, True]
+        assert [should_include_viewing_key(level) for level in PrivacyLevel] == [
+            False,
+            False,
+            True,
+        ]
+
+
+class TestOptimizations:
+    """Tests for chain-specific optimizations."""
+
+    def test_get_chain_characteristics(self):
+        from sip_protocol import ChainFamily, get_chain_characteristics
+
+        assert get_chain_characteristics("solana").family == ChainFamily.SOLANA
+        assert get_chain_characteristics("Arbitrum-One").is_l2
+        assert get_chain_characteristics("cosmoshub").family == ChainFamily.COSMOS
+
+    def test_recommend_cheapest_chain(self):
+        from sip_protocol import recommend_cheapest_chain
+
+        chains = ["ethereum", "arbitrum", "solana"]
+        assert recommend_cheapest_chain(chains) == "solana"
+        assert recommend_cheapest_chain(["ethereum", "optimism", "base"]) == "optimism"
+        assert recommend_cheapest_chain(["ethereum"], max_block_time=1.0) is None
+
+    def test_select_optimal_config(self):
+        from sip_protocol import OptimizationProfile, select_optimal_config
+
+        solana = select_optimal_config("solana", OptimizationProfile.FAST, "simple")
+        assert solana.solana.units == 60_000
+        assert solana.solana.microlamports_per_cu == 2_000
+        assert solana.evm is None
+
+        ethereum = select_optimal_config("ethereum", OptimizationProfile.URGENT, "complex")
+        assert ethereum.evm.gas_limit == 600_000
+        assert ethereum.evm.max_priority_fee_per_gas == 5_000_000_000
+        assert any("L2 alternatives" in r for r in ethereum.recommendations)
+
+    def test_compare_chain_costs(self):
+        from sip_protocol import compare_chain_costs
+
+        results = compare_chain_costs(["ethereum", "unknown-chain", "solana"])
+        assert [chain for chain, _, _ in results] == ["solana", "unknown-chain", "ethereum"]
+        assert results[0] == ("solana", 1, "Excellent - very low costs")